@@ -1,37 +1,74 @@
+import numpy as np
 from pydesim import Model, Intervals, Statistic
 
-from pycsmaca.utilities import ReadOnlyDict
+from pycsmaca.utilities import ReadOnlyDict, intern_address
+
+
+#: Number of samples pre-drawn per block from scipy-style distributions.
+SAMPLES_BATCH_SIZE = 4096
+
+
+def _draw_samples_batch(dist):
+    """Try to pre-draw a block of samples with a scipy-style `rvs(size=K)`.
+
+    Returns a 1-D `np.ndarray` of `SAMPLES_BATCH_SIZE` samples, or `None` if
+    the distribution doesn't support vectorized sampling. Drawing in blocks
+    amortizes the Python call overhead over thousands of samples, while the
+    underlying RNG stream stays the same (just consumed in chunks).
+    """
+    if getattr(type(dist), 'rvs', None) is None:
+        return None
+    try:
+        block = np.asarray(dist.rvs(size=SAMPLES_BATCH_SIZE))
+    except TypeError:
+        return None
+    if block.shape != (SAMPLES_BATCH_SIZE,):
+        return None
+    return block
 
 
 class AppData:
+    """Immutable application payload descriptor.
+
+    Note that instances cannot be cached and shared between arrivals of
+    the same size: `created_at` is unique per packet and `Sink` derives
+    end-to-end delay statistics from it.
+    """
+    __slots__ = ('_dest_addr', '_size', '_source_id', '_created_at', '_str')
+
     def __init__(self, dest_addr=0, size=0, source_id=0, created_at=0):
-        self.__dest_addr = dest_addr
-        self.__size = size
-        self.__source_id = source_id
-        self.__created_at = created_at
+        self._dest_addr = intern_address(dest_addr)
+        self._size = size
+        self._source_id = intern_address(source_id)
+        self._created_at = created_at
+        self._str = None
 
     @property
     def destination_address(self):
-        return self.__dest_addr
+        return self._dest_addr
 
     @property
     def size(self):
-        return self.__size
+        return self._size
 
     @property
     def source_id(self):
-        return self.__source_id
+        return self._source_id
 
     @property
     def created_at(self):
-        return self.__created_at
+        return self._created_at
 
     def __str__(self):
-        fields = ','.join([
-            f'sid={self.source_id}', f'dst={self.destination_address}',
-            f'size={self.size}', f'ct={self.created_at}'
-        ])
-        return f'AppData{{{fields}}}'
+        # All fields are immutable, so the string is built only once even
+        # if the packet is logged multiple times:
+        s = self._str
+        if s is None:
+            s = self._str = (
+                f'AppData{{sid={self._source_id},dst={self._dest_addr},'
+                f'size={self._size},ct={self._created_at}}}'
+            )
+        return s
 
 
 class _SourceBase(Model):
@@ -45,70 +82,99 @@ class _SourceBase(Model):
         :param dest_addr: destination MAC address.
         """
         super().__init__(sim)
-        self.__data_size = data_size
-        self.__source_id = source_id
-        self.__dest_addr = dest_addr
+        self._data_size = data_size
+        self._source_id = source_id
+        self._dest_addr = dest_addr
 
         # Attempt to build iterators for data size and intervals:
         try:
-            self.__data_size_iter = iter(self.__data_size)
+            self._data_size_iter = iter(self._data_size)
         except TypeError:
-            self.__data_size_iter = None
+            self._data_size_iter = None
+
+        # Attempt to pre-draw a batch of sizes from a vectorized sampler:
+        self._data_size_buf = (
+            _draw_samples_batch(data_size)
+            if self._data_size_iter is None else None
+        )
+        self._data_size_cursor = 0
+
+        # Dispatch on the distribution kind once, instead of raising and
+        # catching TypeError on every generated packet:
+        if self._data_size_buf is not None:
+            self._next_size = self._next_size_from_buf
+        elif self._data_size_iter is not None:
+            self._next_size = self._data_size_iter.__next__
+        elif callable(data_size):
+            self._next_size = data_size
+        else:
+            self._next_size = lambda: data_size
 
         # Statistics:
-        self.__arrival_intervals = Intervals()
-        self.__data_size_stat = Statistic()
-        self.__num_packets_sent = 0
+        self._arrival_intervals = Intervals()
+        self._data_size_stat = Statistic()
+        self._num_packets_sent = 0
+
+        # Cached bound methods and connections for the per-packet hot path
+        # (the 'network' connection is wired after construction, so it is
+        # resolved lazily on the first `_generate()` call):
+        self._network_conn = None
+        self._record_arrival = self._arrival_intervals.record
+        self._record_data_size = self._data_size_stat.append
 
     @property
     def arrival_intervals(self):
-        return self.__arrival_intervals
+        return self._arrival_intervals
 
     @property
     def data_size_stat(self):
-        return self.__data_size_stat
+        return self._data_size_stat
 
     @property
     def data_size(self):
-        return self.__data_size
+        return self._data_size
 
     @property
     def source_id(self):
-        return self.__source_id
+        return self._source_id
 
     @property
     def dest_addr(self):
-        return self.__dest_addr
+        return self._dest_addr
 
     @property
     def num_packets_sent(self):
-        return self.__num_packets_sent
+        return self._num_packets_sent
 
     def _generate(self):
         try:
-            data_size = self.__get_next_size()
+            data_size = self._next_size()
         except StopIteration:
             return False # do nothing if stop iteration fired
         else:
+            stime = self.sim.stime
             app_data = AppData(
                 dest_addr=self.dest_addr, size=data_size,
-                source_id=self.source_id, created_at=self.sim.stime
+                source_id=self.source_id, created_at=stime
             )
-            self.connections['network'].send(app_data)
+            conn = self._network_conn
+            if conn is None:
+                conn = self._network_conn = self.connections['network']
+            conn.send(app_data)
             # Recording statistics:
-            self.arrival_intervals.record(self.sim.stime)
-            self.data_size_stat.append(data_size)
-            self.__num_packets_sent += 1
+            self._record_arrival(stime)
+            self._record_data_size(data_size)
+            self._num_packets_sent += 1
             self.sim.logger.debug(f'generated new packet {app_data}', src=self)
             return True
 
-    def __get_next_size(self):
-        if self.__data_size_iter:
-            return next(self.__data_size_iter)
-        try:
-            return self.data_size()
-        except TypeError:
-            return self.data_size
+    def _next_size_from_buf(self):
+        cursor = self._data_size_cursor
+        if cursor >= SAMPLES_BATCH_SIZE:
+            self._data_size_buf = _draw_samples_batch(self._data_size)
+            cursor = 0
+        self._data_size_cursor = cursor + 1
+        return self._data_size_buf[cursor]
 
     def __str__(self):
         prefix = f'{self.parent}.' if self.parent else ''
@@ -139,7 +205,8 @@ class RandomSource(_SourceBase):
     - 'network': connected network layer module; should implement
         `handle_message(app_data)` method.
     """
-    def __init__(self, sim, data_size, interval, source_id, dest_addr):
+    def __init__(self, sim, data_size, interval, source_id, dest_addr,
+                 batch_size=None):
         """Create `RandomSource` module.
 
         :param sim: `pydesim.Simulator` object;
@@ -148,23 +215,50 @@ class RandomSource(_SourceBase):
         :param interval: callable without arguments, iterable or constant;
             represents inter-arrival intervals distribution;
         :param source_id: this source ID (more like IP address, not MAC)
-        :param dest_addr: destination MAC address.
+        :param dest_addr: destination MAC address;
+        :param batch_size: optional number of future arrivals to enqueue
+            per scheduling round; when given, intervals are pre-drawn in
+            blocks and the arrivals scheduled at their cumulative offsets,
+            amortizing the scheduler call overhead. By default every
+            arrival schedules only the next one.
         """
         super().__init__(sim, data_size, source_id, dest_addr)
-        self.__interval = interval
+        self._interval = interval
+        self._batch_size = batch_size
+        self._generate_base = super()._generate
 
         # Attempt to build iterators for data size and intervals:
         try:
-            self.__interval_iter = iter(self.__interval)
+            self._interval_iter = iter(self._interval)
         except TypeError:
-            self.__interval_iter = None
+            self._interval_iter = None
+
+        # Attempt to pre-draw a batch of intervals from a vectorized sampler:
+        self._interval_buf = (
+            _draw_samples_batch(interval)
+            if self._interval_iter is None else None
+        )
+        self._interval_cursor = 0
+
+        # Dispatch on the distribution kind once (see `_SourceBase`):
+        if self._interval_buf is not None:
+            self._next_interval = self._next_interval_from_buf
+        elif self._interval_iter is not None:
+            self._next_interval = self._interval_iter.__next__
+        elif callable(interval):
+            self._next_interval = interval
+        else:
+            self._next_interval = lambda: interval
+
+        # Cache `sim.schedule` to avoid re-resolving it on every arrival:
+        self._schedule = sim.schedule
 
         # Initialize:
         self._schedule_next_arrival()
 
     @property
     def interval(self):
-        return self.__interval
+        return self._interval
 
     def _generate(self):
         if super()._generate():
@@ -173,18 +267,45 @@ class RandomSource(_SourceBase):
         return False
 
     def _get_next_interval(self):
-        if self.__interval_iter is not None:
-            return next(self.__interval_iter)
-        try:
-            return self.interval()
-        except TypeError:
-            return self.interval
+        return self._next_interval()
+
+    def _next_interval_from_buf(self):
+        cursor = self._interval_cursor
+        if cursor >= SAMPLES_BATCH_SIZE:
+            self._interval_buf = _draw_samples_batch(self._interval)
+            cursor = 0
+        self._interval_cursor = cursor + 1
+        return self._interval_buf[cursor]
 
     def _schedule_next_arrival(self):
+        if self._batch_size is not None:
+            self._schedule_arrivals_batch()
+            return
+        try:
+            self._schedule(self._get_next_interval(), self._generate)
+        except StopIteration:
+            pass
+
+    def _schedule_arrivals_batch(self):
+        # Draw a block of inter-arrival intervals and enqueue the whole
+        # block; the last arrival of the block schedules the next one:
+        intervals = []
         try:
-            self.sim.schedule(self._get_next_interval(), self._generate)
+            for _ in range(self._batch_size):
+                intervals.append(self._get_next_interval())
         except StopIteration:
             pass
+        if not intervals:
+            return
+        offsets = np.cumsum(intervals)
+        schedule, generate = self._schedule, self._generate_base
+        for delay in offsets[:-1]:
+            schedule(delay, generate)
+        schedule(offsets[-1], self._handle_batch_end)
+
+    def _handle_batch_end(self):
+        if self._generate_base():
+            self._schedule_arrivals_batch()
 
 
 class ControlledSource(_SourceBase):
@@ -245,36 +366,36 @@ class Sink(Model):
     """
     def __init__(self, sim):
         super().__init__(sim)
-        self.__source_delays_data = {}
-        self.__source_delays = ReadOnlyDict(self.__source_delays_data)
-        self.__arrival_intervals = Intervals()
-        self.__data_size_stat = Statistic()
-        self.__num_packets_received = 0
+        self._source_delays_data = {}
+        self._source_delays = ReadOnlyDict(self._source_delays_data)
+        self._arrival_intervals = Intervals()
+        self._data_size_stat = Statistic()
+        self._num_packets_received = 0
 
     @property
     def arrival_intervals(self):
-        return self.__arrival_intervals
+        return self._arrival_intervals
 
     @property
     def data_size_stat(self):
-        return self.__data_size_stat
+        return self._data_size_stat
 
     @property
     def source_delays(self):
-        return self.__source_delays
+        return self._source_delays
 
     @property
     def num_packets_received(self):
-        return self.__num_packets_received
+        return self._num_packets_received
 
     def handle_message(self, app_data, sender=None, connection=None):
         sid = app_data.source_id
         if sid not in self.source_delays:
-            self.__source_delays_data[sid] = Statistic()
+            self._source_delays_data[sid] = Statistic()
         self.source_delays[sid].append(self.sim.stime - app_data.created_at)
         self.arrival_intervals.record(self.sim.stime)
         self.data_size_stat.append(app_data.size)
-        self.__num_packets_received += 1
+        self._num_packets_received += 1
         self.sim.logger.debug(f'received {app_data}', src=self)
 
     def __str__(self):
@@ -1,6 +1,6 @@
 from pydesim import Model
 
-from pycsmaca.utilities import ReadOnlyDict
+from pycsmaca.utilities import ReadOnlyDict, intern_address
 
 
 class NetworkPacket:
@@ -28,13 +28,29 @@ class NetworkPacket:
     `NetworkPacket` can also handle a payload (`data`), which is expected
     to be `AppData`.
     """
+    __slots__ = (
+        'destination_address', 'originator_address', 'sender_address',
+        'receiver_address', 'osn', 'data',
+    )
+
     def __init__(
             self, destination_address=None, originator_address=None,
             receiver_address=None, sender_address=None, osn=None, data=None):
-        self.destination_address = destination_address
-        self.originator_address = originator_address
-        self.sender_address = sender_address
-        self.receiver_address = receiver_address
+        self.reset(
+            destination_address=destination_address,
+            originator_address=originator_address,
+            receiver_address=receiver_address,
+            sender_address=sender_address, osn=osn, data=data,
+        )
+
+    def reset(
+            self, destination_address=None, originator_address=None,
+            receiver_address=None, sender_address=None, osn=None, data=None):
+        """Re-initialize all fields."""
+        self.destination_address = intern_address(destination_address)
+        self.originator_address = intern_address(originator_address)
+        self.sender_address = intern_address(sender_address)
+        self.receiver_address = intern_address(receiver_address)
         self.osn = osn
         self.data = data
 
@@ -43,17 +59,14 @@ class NetworkPacket:
         return self.data.size if self.data else 0
 
     def __str__(self):
-        fields = []
-        for field, value in [
+        pairs = (
             ('DST', self.destination_address),
             ('ORIGIN', self.originator_address),
             ('SND', self.sender_address),
             ('RCV', self.receiver_address),
-            ('OSN', self.osn)
-        ]:
-            if value is not None:
-                fields.append(f'{field}={value}')
-        header = ','.join(fields)
+            ('OSN', self.osn),
+        )
+        header = ','.join(f'{k}={v}' for k, v in pairs if v is not None)
         body = f' | {self.data}' if self.data is not None else ''
         return f'NetPkt{{{header}{body}}}'
 
@@ -83,15 +96,37 @@ class NetworkService(Model):
     """
     def __init__(self, sim):
         super().__init__(sim)
+        # Connections are captured on the first message (they are wired
+        # after construction), so per-message dispatch is two identity
+        # checks instead of dict gets plus equality tests:
+        self._wired = False
+        self._source_conn = None
+        self._network_conn = None
+        self._network_send = None
+        self._sink_send = None
+
+    def _capture_connections(self):
+        connections = self.connections
+        self._source_conn = connections.get('source')
+        self._network_conn = connections.get('network')
+        if self._network_conn is not None:
+            self._network_send = self._network_conn.send
+        self._wired = True
 
     def handle_message(self, message, connection=None, sender=None):
-        if connection == self.connections.get('source'):
+        if not self._wired:
+            self._capture_connections()
+        if connection is self._source_conn:
             packet = NetworkPacket(
-                destination_address=message.destination_address, data=message
+                destination_address=message.destination_address,
+                data=message,
             )
-            self.connections['network'].send(packet)
-        elif connection == self.connections.get('network'):
-            self.connections['sink'].send(message.data)
+            self._network_send(packet)
+        elif connection is self._network_conn:
+            sink_send = self._sink_send
+            if sink_send is None:
+                sink_send = self._sink_send = self.connections['sink'].send
+            sink_send(message.data)
 
     def __str__(self):
         prefix = f'{self.parent}.' if self.parent else ''
@@ -112,40 +147,91 @@ class SwitchTable:
     Records MAY be updated later during the simulation.
     """
     class Link:
-        def __init__(self, connection, next_hop):
-            self.connection = connection
-            self.next_hop = next_hop
+        __slots__ = ('_connection', '_next_hop', '_tuple', '_table')
+
+        def __init__(self, connection, next_hop, table=None):
+            self._connection = connection
+            self._next_hop = next_hop
+            # The owning table is kept so in-place updates can drop its
+            # cached view along with the precomputed tuple:
+            self._table = table
+            # The tuple view is precomputed here and refreshed by the
+            # setters, so as_tuple() never allocates on the hot path:
+            self._tuple = (connection, next_hop)
+
+        @property
+        def connection(self):
+            return self._connection
+
+        @connection.setter
+        def connection(self, value):
+            self._connection = value
+            self._tuple = (value, self._next_hop)
+            if self._table is not None:
+                self._table._cache = None
+
+        @property
+        def next_hop(self):
+            return self._next_hop
+
+        @next_hop.setter
+        def next_hop(self, value):
+            self._next_hop = value
+            self._tuple = (self._connection, value)
+            if self._table is not None:
+                self._table._cache = None
 
         def as_tuple(self):
-            return self.connection, self.next_hop
+            return self._tuple
 
         def __str__(self):
             return f'conn={self.connection}, next_hop={self.next_hop}'
 
     def __init__(self):
-        self.__records = {}
+        self._records = {}
+        self._cache = None
 
     def add(self, dst, connection, next_hop):
-        self.__records[dst] = SwitchTable.Link(connection, next_hop)
+        dst = intern_address(dst)
+        self._records[dst] = SwitchTable.Link(connection, next_hop, self)
+        self._cache = None
+
+    def bulk_load(self, entries):
+        """Add many routes at once from `(dst, connection, next_hop)` tuples.
+
+        Loads all records with a single cache invalidation, so topology
+        builders don't pay per-entry bookkeeping.
+        """
+        records = self._records
+        for dst, connection, next_hop in entries:
+            records[intern_address(dst)] = SwitchTable.Link(
+                connection, next_hop, self
+            )
+        self._cache = None
 
     def as_dict(self):
-        return ReadOnlyDict({
-            dst: link.as_tuple() for dst, link in self.__records.items()
-        })
+        # Routes change rarely but are read often, so the view is cached
+        # and invalidated on `add()`, `bulk_load()` and in-place link
+        # updates:
+        if self._cache is None:
+            self._cache = ReadOnlyDict({
+                dst: link.as_tuple() for dst, link in self._records.items()
+            })
+        return self._cache
 
     def __getitem__(self, dst):
-        return self.__records[dst]
+        return self._records[dst]
 
     def get(self, dst, default=None):
-        return self.__records.get(dst, default)
+        return self._records.get(dst, default)
 
     def __contains__(self, dst):
-        return dst in self.__records
+        return dst in self._records
 
     def __str__(self):
         records = (
             f'{dst}: ({link.connection}, {link.next_hop})'
-            for dst, link in self.__records.items()
+            for dst, link in self._records.items()
         )
         return f'SwitchTable{{{", ".join(records)}}}'
 
@@ -178,12 +264,36 @@ class NetworkSwitch(Model):
     """
     def __init__(self, sim):
         super().__init__(sim)
-        self.__table = SwitchTable()
-        self.__osn_table = {}
+        self._table = SwitchTable()
+        self._osn_table = {}
+        # Lazily built {address: connection_name} map of the connected
+        # interfaces, used for O(1) local-delivery checks in handle_message:
+        self._local_addrs = None
 
     @property
     def table(self):
-        return self.__table
+        return self._table
+
+    def register_interface(self, conn_name, address):
+        """Explicitly register an interface-bearing connection.
+
+        Called once per interface at topology build time (see `Station`).
+        Registered switches never fall back to probing connected modules
+        for an `address` attribute when packets are handled.
+        """
+        if self._local_addrs is None:
+            self._local_addrs = {}
+        self._local_addrs[intern_address(address)] = conn_name
+
+    def _build_local_addrs(self):
+        # Fallback for manually wired topologies that never called
+        # `register_interface()`:
+        addrs = {}
+        for name, module in self.connections.as_dict().items():
+            address = getattr(module, 'address', None)
+            if address is not None:
+                addrs[address] = name
+        return addrs
 
     def handle_message(self, message, connection=None, sender=None):
         assert isinstance(message, NetworkPacket)
@@ -198,26 +308,33 @@ class NetworkSwitch(Model):
         # - if the switch ever received packets from the originator, but the
         #   stored OSN is greater or equal to the received one, it drops the
         #   packet silently and stops serving.
-        if message.originator_address is not None:
-            assert message.osn is not None
-            # Check that this message is not too old by checking its SSN:
-            if message.originator_address not in self.__osn_table:
-                self.__osn_table[message.originator_address] = message.osn
-            elif message.osn <= self.__osn_table[message.originator_address]:
+        originator = message.originator_address
+        if originator is not None:
+            osn = message.osn
+            assert osn is not None
+            # Check that this message is not too old by checking its SSN
+            # (a single get() plus one store instead of up to three dict
+            # operations per packet):
+            osn_table = self._osn_table
+            prev_osn = osn_table.get(originator)
+            if prev_osn is not None and osn <= prev_osn:
                 return  # do not process this message due to old SSN
-            else:
-                self.__osn_table[message.originator_address] = message.osn
+            osn_table[originator] = osn
 
         # 2) By using the destination address, the Switch checks whether
         # ANY of its connected interface has the given address. If such
         # interface found, it means that the message destination is the
         # station the switch is contained in, so it sends the message up to
         # `NetworkService` for decapsulation and sending then it up to a user.
-        for _, module in self.connections.as_dict().items():
-            if (hasattr(module, 'address') and
-                    module.address == message.destination_address):
-                self.connections['user'].send(message)
-                return
+        # The {address: connection_name} map is built once on the first
+        # packet, so the check is a single dict probe instead of a scan
+        # over all connections.
+        local_addrs = self._local_addrs
+        if local_addrs is None:
+            local_addrs = self._local_addrs = self._build_local_addrs()
+        if message.destination_address in local_addrs:
+            self.connections['user'].send(message)
+            return
 
         # 3) If an interface with destination address not found, the switch
         # tries to forward the packet. It looks up its switching table to
@@ -246,14 +363,14 @@ class NetworkSwitch(Model):
         #   and OSN were filled by some another module (typically, originator
         #   switch).
         if connection.name == 'user':
-            message.originator_address = iface_connection.module.address
+            originator = iface_connection.module.address
+            message.originator_address = originator
 
             # Choose, assign and inc SSN for the given source address:
-            if message.originator_address not in self.__osn_table:
-                self.__osn_table[message.originator_address] = 0
-            else:
-                self.__osn_table[message.originator_address] += 1
-            message.osn = self.__osn_table[message.originator_address]
+            osn_table = self._osn_table
+            osn = osn_table.get(originator, -1) + 1
+            osn_table[originator] = osn
+            message.osn = osn
         else:
             assert message.originator_address is not None
             assert message.osn is not None
@@ -1,6 +1,8 @@
 from collections import deque
 
-from pydesim import Model, Trace, Intervals, Statistic
+from pydesim import Model, Intervals, Statistic
+
+from pycsmaca.utilities import ArrayTrace
 
 
 class QueuedPacket:
@@ -63,53 +65,54 @@ class Queue(Model):
     """
     def __init__(self, sim, capacity=None):
         super().__init__(sim)
-        self.__capacity = capacity
-        self.__packets = deque()
-        self.__data_requests = deque()
+        self._capacity = capacity
+        self._packets = deque()
+        self._data_requests = deque()
+        self._bitsize = 0
         # Statistics:
-        self.__num_dropped = 0
-        self.__num_arrived = 0
-        self.__size_trace = Trace()
-        self.__bitsize_trace = Trace()
-        self.__size_trace.record(sim.stime, 0)
-        self.__bitsize_trace.record(sim.stime, 0)
-        self.__arrival_intervals = Intervals()
-        self.__arrival_intervals.record(self.sim.stime)
-        self.__wait_intervals = Statistic()
+        self._num_dropped = 0
+        self._num_arrived = 0
+        self._size_trace = ArrayTrace()
+        self._bitsize_trace = ArrayTrace()
+        self._size_trace.record(sim.stime, 0)
+        self._bitsize_trace.record(sim.stime, 0)
+        self._arrival_intervals = Intervals()
+        self._arrival_intervals.record(self.sim.stime)
+        self._wait_intervals = Statistic()
 
     @property
     def capacity(self):
-        return self.__capacity
+        return self._capacity
 
     @property
     def num_dropped(self):
-        return self.__num_dropped
+        return self._num_dropped
     
     @property
     def num_arrived(self):
-        return self.__num_arrived
+        return self._num_arrived
     
     @property
     def drop_ratio(self):
-        if self.__num_arrived > 0:
-            return self.__num_dropped / self.__num_arrived
+        if self._num_arrived > 0:
+            return self._num_dropped / self._num_arrived
         return 0
 
     @property
     def size_trace(self):
-        return self.__size_trace
+        return self._size_trace
 
     @property
     def bitsize_trace(self):
-        return self.__bitsize_trace
+        return self._bitsize_trace
     
     @property
     def arrival_intervals(self):
-        return self.__arrival_intervals
+        return self._arrival_intervals
     
     @property
     def wait_intervals(self):
-        return self.__wait_intervals
+        return self._wait_intervals
 
     def empty(self):
         return len(self) == 0
@@ -118,42 +121,51 @@ class Queue(Model):
         return len(self) == self.capacity
 
     def __len__(self):
-        return len(self.__packets)
+        return len(self._packets)
 
     def size(self):
         return len(self)
 
     def bitsize(self):
-        return sum(pkt.size for pkt in self.__packets)
+        # A running sum updated in `push()` and `pop()`, so the call is O(1)
+        # instead of iterating the stored packets:
+        return self._bitsize
 
     def as_tuple(self):
-        return tuple(self.__packets)
+        return tuple(self._packets)
 
     def push(self, packet):
-        self.__num_arrived += 1
-        self.__arrival_intervals.record(self.sim.stime)
-        if self.__data_requests:
-            connection = self.__data_requests.popleft()
-            connection.send(packet)
-            self.__wait_intervals.append(0.0)
+        stime = self.sim.stime
+        self._num_arrived += 1
+        self._arrival_intervals.record(stime)
+        # Fast path first: a consumer is already waiting, so the packet is
+        # forwarded right away and never stored (no traces to update):
+        data_requests = self._data_requests
+        if data_requests:
+            data_requests.popleft().send(packet)
+            self._wait_intervals.append(0.0)
+            return
+        packets = self._packets
+        if self._capacity is None or len(packets) < self._capacity:
+            qp = QueuedPacket(packet, arrived_at=stime)
+            packets.append(qp)
+            self._bitsize += qp.size
+            self._size_trace.record(stime, len(packets))
+            self._bitsize_trace.record(stime, self._bitsize)
         else:
-            if self.capacity is None or len(self) < self.capacity:
-                qp = QueuedPacket(packet, arrived_at=self.sim.stime)
-                self.__packets.append(qp)
-                self.__size_trace.record(self.sim.stime, len(self))
-                self.__bitsize_trace.record(self.sim.stime, self.bitsize())
-            else:
-                self.__num_dropped += 1
+            self._num_dropped += 1
 
     def pop(self):
         try:
-            qp = self.__packets.popleft()
+            qp = self._packets.popleft()
         except IndexError as err:
             raise ValueError('pop from empty Queue') from err
         else:
-            self.__size_trace.record(self.sim.stime, len(self))
-            self.__bitsize_trace.record(self.sim.stime, self.bitsize())
-            self.__wait_intervals.append(self.sim.stime - qp.arrived_at)
+            stime = self.sim.stime
+            self._bitsize -= qp.size
+            self._size_trace.record(stime, len(self._packets))
+            self._bitsize_trace.record(stime, self._bitsize)
+            self._wait_intervals.append(stime - qp.arrived_at)
             return qp.packet
 
     def get_next(self, service):
@@ -161,7 +173,7 @@ class Queue(Model):
         if not self.empty():
             connection.send(self.pop())
         else:
-            self.__data_requests.append(connection)
+            self._data_requests.append(connection)
 
     def handle_message(self, message, connection=None, sender=None):
         self.push(message)
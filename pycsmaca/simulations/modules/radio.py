@@ -165,17 +165,29 @@ class ConnectionManager(Model):
     def __init__(self, sim):
         super().__init__(sim)
         self.connected_radios = {}
+        # Structure-of-arrays mirror of the registered radios; distances
+        # to all of them are computed in one vectorized pass per add_radio:
+        self.__radios = []
+        self.__xs = []
+        self.__ys = []
+        self.__radii = []
 
     def add_radio(self, radio):
         if radio not in self.connected_radios:
             self.connected_radios[radio] = []
+        else:
+            # Re-registration: drop the stale mirror entry first.
+            i = self.__radios.index(radio)
+            del self.__radios[i], self.__xs[i], self.__ys[i], self.__radii[i]
 
+        x, y = radio.position
+        radius = radio.connection_radius
         peers = []
-        for peer in self.connected_radios.keys():
-            if peer == radio:
-                continue
-            d = norm(peer.position - radio.position)
-            if peer.connection_radius >= d and radio.connection_radius >= d:
+        if self.__radios:
+            d = np.hypot(np.asarray(self.__xs) - x, np.asarray(self.__ys) - y)
+            mask = (d <= radius) & (d <= np.asarray(self.__radii))
+            for i in np.flatnonzero(mask):
+                peer = self.__radios[i]
                 peers.append(peer)
                 if radio not in self.connected_radios[peer]:
                     self.connected_radios[peer].append(radio)
@@ -185,6 +197,10 @@ class ConnectionManager(Model):
                     src=self
                 )
 
+        self.__radios.append(radio)
+        self.__xs.append(float(x))
+        self.__ys.append(float(y))
+        self.__radii.append(float(radius))
         self.connected_radios[radio] = peers
 
     def get_peers(self, radio):
@@ -26,7 +26,9 @@ class Station(Model):
         sink.connections.set('network', network_service, rname='sink')
         network_service.connections.set('network', switch, rname='user')
         for i, iface in enumerate(interfaces):
-            switch.connections.set(f'if{i}', iface, rname='user')
+            conn_name = f'if{i}'
+            switch.connections.set(conn_name, iface, rname='user')
+            switch.register_interface(conn_name, iface.address)
     
     @property
     def source(self):
@@ -1,25 +1,48 @@
 from numpy import inf
-from pydesim import Model, Trace, Statistic
+from pydesim import Model
+
+from pycsmaca.utilities import ArrayStatistic, ArrayTrace
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+
+def _compute_duration(header_size, size, bitrate, preamble):
+    """Time to put a frame with the given payload `size` on the wire."""
+    return (header_size + size) / bitrate + preamble
+
+
+if njit is not None:
+    # When numba is installed the duration computation is lowered to native
+    # code. No fastmath: results must be bit-identical to the plain
+    # expression above.
+    _compute_duration = njit(cache=True)(_compute_duration)
 
 
 class WireFrame:
+    __slots__ = ('packet', 'duration', 'header_size', 'preamble', '_hdr_pr')
+
     def __init__(self, packet, duration=0, header_size=0, preamble=0):
         self.packet = packet
         self.duration = duration
         self.header_size = header_size
         self.preamble = preamble
+        # Header size and preamble never change after construction, so the
+        # invariant part of the string view is built once:
+        self._hdr_pr = f'HDR={header_size},PR={preamble}'
 
     @property
     def size(self):
         return self.header_size + (self.packet.size if self.packet else 0)
 
     def __str__(self):
-        fields = ','.join([
-            f'D={self.duration}', f'HDR={self.header_size}',
-            f'PR={self.preamble}'
-        ])
         body = f' | {self.packet}' if self.packet else ''
-        return f'WireFrame[{fields}{body}]'
+        return f'WireFrame[D={self.duration},{self._hdr_pr}{body}]'
+
+    def __repr__(self):
+        return str(self)
 
 
 class WiredTransceiver(Model):
@@ -65,131 +88,168 @@ class WiredTransceiver(Model):
         self.header_size = header_size
         self.preamble = preamble
         self.ifs = ifs
-        # State variables:
-        self.__started = False
-        self.__tx_frame = None
-        self.__wait_ifs = False
-        self.__rx_frame = None
+        # State variables. The busy flags are plain booleans updated at
+        # state transitions, so the predicates polled by neighbors reduce
+        # to a single attribute read:
+        self._started = False
+        self._tx_frame = None
+        self._tx_busy = False
+        self._rx_frame = None
+        self._rx_busy = False
         # Statistics:
-        self.__num_received_frames = 0
-        self.__num_received_bits = 0
-        self.__rx_busy_trace = Trace()
-        self.__rx_busy_trace.record(0, 0)
-        self.__num_transmitted_packets = 0
-        self.__num_transmitted_bits = 0
-        self.__tx_busy_trace = Trace()
-        self.__tx_busy_trace.record(0, 0)
-        self.__service_time = Statistic()
-        self.__service_started_at = None
+        self._num_received_frames = 0
+        self._num_received_bits = 0
+        self._rx_busy_trace = ArrayTrace()
+        self._rx_busy_trace.record(0, 0)
+        self._num_transmitted_packets = 0
+        self._num_transmitted_bits = 0
+        self._tx_busy_trace = ArrayTrace()
+        self._tx_busy_trace.record(0, 0)
+        self._service_time = ArrayStatistic()
+        self._service_started_at = None
+        # Cached bound methods for scheduled callbacks (avoids rebuilding
+        # a bound-method object per scheduled event), plus lazily resolved
+        # peer/queue callables (connections are wired after construction):
+        self._on_tx_end = self.handle_tx_end
+        self._on_ifs_end = self.handle_ifs_end
+        self._on_rx_end = self.handle_rx_end
+        self._peer_send = None
+        self._queue_get_next = None
+        self._up_send = None
         # Initialization:
         self.sim.schedule(self.sim.stime, self.start)
 
     @property
     def started(self):
-        return self.__started
+        return self._started
 
     @property
     def tx_ready(self):
-        return not self.tx_busy
+        return not self._tx_busy
 
     @property
     def tx_busy(self):
-        return self.__tx_frame is not None or self.__wait_ifs
+        return self._tx_busy
 
     @property
     def rx_ready(self):
-        return self.__rx_frame is None
+        return not self._rx_busy
 
     @property
     def rx_busy(self):
-        return not self.rx_ready
+        return self._rx_busy
 
     @property
     def num_received_frames(self):
-        return self.__num_received_frames
+        return self._num_received_frames
 
     @property
     def num_received_bits(self):
-        return self.__num_received_bits
+        return self._num_received_bits
 
     @property
     def rx_busy_trace(self):
-        return self.__rx_busy_trace
+        return self._rx_busy_trace
 
     @property
     def num_transmitted_packets(self):
-        return self.__num_transmitted_packets
+        return self._num_transmitted_packets
 
     @property
     def num_transmitted_bits(self):
-        return self.__num_transmitted_bits
+        return self._num_transmitted_bits
 
     @property
     def tx_busy_trace(self):
-        return self.__tx_busy_trace
+        return self._tx_busy_trace
 
     @property
     def service_time(self):
-        return self.__service_time
+        return self._service_time
 
     @property
     def tx_frame(self):
-        return self.__tx_frame
+        return self._tx_frame
 
     def start(self):
-        self.connections['queue'].module.get_next(self)
-        self.__started = True
+        get_next = self._queue_get_next = \
+            self.connections['queue'].module.get_next
+        get_next(self)
+        self._started = True
 
     def handle_message(self, message, connection=None, sender=None):
-        if connection.name == 'queue':
-            if self.tx_busy:
+        # One attribute read instead of one per branch:
+        name = connection.name
+        if name == 'queue':
+            if self._tx_busy:
                 raise RuntimeError('new NetworkPacket while another TX running')
-            duration = ((self.header_size + message.size) / self.bitrate +
-                        self.preamble)
+            duration = _compute_duration(
+                self.header_size, message.size, self.bitrate, self.preamble
+            )
             frame = WireFrame(
                 packet=message, duration=duration, header_size=self.header_size,
                 preamble=self.preamble
             )
-            self.connections['peer'].send(frame)
-            self.sim.schedule(duration, self.handle_tx_end)
-            self.__tx_frame = frame
-            self.__tx_busy_trace.record(self.sim.stime, 1)
-            self.__service_started_at = self.sim.stime
+            peer_send = self._peer_send
+            if peer_send is None:
+                peer_send = self._peer_send = self.connections['peer'].send
+            peer_send(frame)
+            self.sim.schedule(duration, self._on_tx_end)
+            self._tx_frame = frame
+            self._tx_busy = True
+            self._tx_busy_trace.record(self.sim.stime, 1)
+            self._service_started_at = self.sim.stime
             self.sim.logger.debug(f'start transmitting frame {frame}', src=self)
-        elif connection.name == 'peer':
+        elif name == 'peer':
             self.sim.schedule(
-                message.duration, self.handle_rx_end, args=(message,)
+                message.duration, self._on_rx_end, args=(message,)
             )
-            self.__rx_frame = message
-            self.__rx_busy_trace.record(self.sim.stime, 1)
+            self._rx_frame = message
+            self._rx_busy = True
+            self._rx_busy_trace.record(self.sim.stime, 1)
             self.sim.logger.debug(f'start receiving frame {message}', src=self)
 
     def handle_tx_end(self):
-        self.sim.schedule(self.ifs, self.handle_ifs_end)
+        # The IFS hop is scheduled even when ifs == 0: TX-end and IFS-end
+        # are distinct observable states (TX stays busy and no new packet
+        # may be requested until the IFS event fires), so collapsing them
+        # into one event would change the transceiver protocol.
+        self.sim.schedule(self.ifs, self._on_ifs_end)
         # Record statistics:
-        self.__num_transmitted_packets += 1
-        self.__num_transmitted_bits += self.__tx_frame.size
-        # Update state variables:
-        self.__wait_ifs = True
-        self.__tx_frame = None
+        self._num_transmitted_packets += 1
+        self._num_transmitted_bits += self._tx_frame.size
+        # Update state variables (TX stays busy until the IFS ends):
+        self._tx_frame = None
         self.sim.logger.debug(f'finish transmitting, waiting IFS', src=self)
 
     def handle_ifs_end(self):
-        self.__wait_ifs = False
-        self.connections['queue'].module.get_next(self)
+        self._tx_busy = False
+        get_next = self._queue_get_next
+        if get_next is None:
+            get_next = self._queue_get_next = \
+                self.connections['queue'].module.get_next
+        get_next(self)
         # Record statistics:
-        self.__tx_busy_trace.record(self.sim.stime, 0)
-        self.__service_time.append(self.sim.stime - self.__service_started_at)
-        self.__service_started_at = None
+        self._tx_busy_trace.record(self.sim.stime, 0)
+        self._service_time.append(self.sim.stime - self._service_started_at)
+        self._service_started_at = None
         self.sim.logger.debug(f'IFS end, ready to transmit', src=self)
 
     def handle_rx_end(self, frame):
-        if 'up' in self.connections:
-            self.connections['up'].send(frame.packet)
-        self.__rx_frame = None
-        self.__num_received_frames += 1
-        self.__num_received_bits += frame.size
-        self.__rx_busy_trace.record(self.sim.stime, 0)
+        up_send = self._up_send
+        if up_send is None:
+            # Resolved on first reception; without an 'up' connection the
+            # packet is dropped and the probe repeats on the next frame:
+            conn = self.connections.get('up')
+            if conn is not None:
+                up_send = self._up_send = conn.send
+        if up_send is not None:
+            up_send(frame.packet)
+        self._rx_frame = None
+        self._rx_busy = False
+        self._num_received_frames += 1
+        self._num_received_bits += frame.size
+        self._rx_busy_trace.record(self.sim.stime, 0)
         self.sim.logger.debug(f'finish receiving frame', src=self)
 
     def __str__(self):
@@ -225,13 +285,14 @@ class WiredInterface(Model):
         return self.__transceiver
 
     def handle_message(self, message, connection=None, sender=None):
-        if connection.name == 'user':
+        name = connection.name
+        if name == 'user':
             self.connections['_queue'].send(message)
-        elif connection.name == 'wire':
+        elif name == 'wire':
             self.connections['_peer'].send(message)
-        elif connection.name == '_receiver':
+        elif name == '_receiver':
             self.connections['user'].send(message)
-        elif connection.name == '_peer':
+        elif name == '_peer':
             self.connections['wire'].send(message)
 
     def __str__(self):
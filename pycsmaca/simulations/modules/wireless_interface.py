@@ -2,9 +2,10 @@ import math
 from enum import Enum
 
 from numpy.random.mtrand import randint
-from pydesim import Model, Statistic, Trace
+from pydesim import Model
 
 from pycsmaca.simulations.modules import NetworkPacket
+from pycsmaca.utilities import ArrayStatistic, ArrayTrace
 
 
 class PDUBase:
@@ -191,13 +192,14 @@ class Transmitter(Model):
         self.__state = Transmitter.State.IDLE
         self.__seqn = 0
 
-        # Statistics:
-        self.backoff_vector = Statistic()
+        # Statistics (array-backed, so means and time-averages reduce to
+        # vectorized NumPy aggregations over contiguous storage):
+        self.backoff_vector = ArrayStatistic()
         self.__start_service_time = None
-        self.service_time = Statistic()
+        self.service_time = ArrayStatistic()
         self.num_sent = 0
-        self.num_retries_vector = Statistic()
-        self.__busy_trace = Trace()
+        self.num_retries_vector = ArrayStatistic()
+        self.__busy_trace = ArrayTrace()
         self.__busy_trace.record(sim.stime, 0)
 
         # Initialize:
@@ -433,7 +435,7 @@ class Receiver(Model):
         # Statistics:
         self.__num_collisions = 0
         self.__num_received = 0
-        self.__busy_trace = Trace()
+        self.__busy_trace = ArrayTrace()
         self.__busy_trace.record(sim.stime, 0)
 
     @property
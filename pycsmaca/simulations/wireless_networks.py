@@ -1,5 +1,6 @@
-from math import pi, cos, sin
+from math import pi
 
+import numpy as np
 from numpy.random.mtrand import uniform
 from pydesim import Model
 
@@ -19,18 +20,48 @@ class _HalfDuplexNetworkBase(Model):
         # Building connection manager:
         self.__conn_manager = ConnectionManager(sim)
 
-        self.__stations = []
-
-        conn_radius = sim.params.connection_radius
-        for i in range(sim.params.num_stations):
+        # All station positions are generated in one batch up front instead
+        # of once per station inside the loop below. They are kept as two
+        # coordinate arrays (structure-of-arrays), so distance computations
+        # over them can be vectorized:
+        self.__xs, self.__ys = self._precompute_positions()
+
+
+        # Loop-invariant parameters, read once. Transmitter, Receiver and
+        # Radio carry per-station mutable state (backoff, sequence numbers,
+        # statistics), so the instances cannot be shared, but the shared
+        # parameters are resolved here instead of once per instance:
+        params = sim.params
+        conn_radius = params.connection_radius
+        max_propagation = conn_radius / params.speed_of_light
+        n = params.num_stations
+        phy_header_size = params.phy_header_size
+        mac_header_size = params.mac_header_size
+        ack_size = params.ack_size
+        bitrate = params.bitrate
+        preamble = params.preamble
+        sifs = params.sifs
+
+        # Pre-sized, filled by index below:
+        self.__stations = [None] * n
+
+        for i in range(n):
             # Building elementary components:
             source = self.create_source(i)
-            max_propagation = conn_radius / sim.params.speed_of_light
-            transmitter = Transmitter(sim, max_propagation=max_propagation)
-            receiver = Receiver(sim)
+            transmitter = Transmitter(
+                sim, phy_header_size=phy_header_size,
+                mac_header_size=mac_header_size, ack_size=ack_size,
+                bitrate=bitrate, preamble=preamble,
+                max_propagation=max_propagation,
+            )
+            receiver = Receiver(
+                sim, sifs=sifs, phy_header_size=phy_header_size,
+                ack_size=ack_size,
+            )
             queue = self.create_queue(i, source=source)
             radio = Radio(
                 sim, self.__conn_manager,
+                preamble=preamble, bitrate=bitrate,
                 connection_radius=conn_radius,
                 position=self.get_position(i)
             )
@@ -40,10 +71,13 @@ class _HalfDuplexNetworkBase(Model):
                                       receiver, radio)
 
             # Building station:
-            sta = Station(sim, source=source, interfaces=[iface])
-            self.__stations.append(sta)
+            self.__stations[i] = Station(
+                sim, source=source, interfaces=[iface]
+            )
 
-            # Writing switching table:
+        # Writing switching tables in a separate pass, once all stations
+        # are built:
+        for i in range(n):
             self.write_switch_table(i)
 
         # Adding stations as children:
@@ -59,9 +93,13 @@ class _HalfDuplexNetworkBase(Model):
     def create_queue(self, index, source=None):
         return Queue(self.sim)
 
-    def get_position(self, index):
+    def _precompute_positions(self):
+        """Return x- and y-coordinates of all stations as two arrays."""
         raise NotImplementedError
 
+    def get_position(self, index):
+        return float(self.__xs[index]), float(self.__ys[index])
+
     def write_switch_table(self, index):
         raise NotImplementedError
 
@@ -195,19 +233,20 @@ class WirelessHalfDuplexLineNetwork(_HalfDuplexNetworkBase):
     def destination_address(self):
         return self.sim.params.num_stations
 
-    def get_position(self, index):
-        return index * self.sim.params.distance, 0
+    def _precompute_positions(self):
+        n = self.sim.params.num_stations
+        return np.arange(n) * self.sim.params.distance, np.zeros(n)
 
     def write_switch_table(self, index):
         if index < self.sim.params.num_stations - 1:
             sta = self.stations[index]
             iface = sta.interfaces[0]
             switch_conn = sta.get_switch_connection_for(iface)
-            sta.switch.table.add(
+            sta.switch.table.bulk_load([(
                 self.destination_address,
                 switch_conn.name,
                 iface.address + 1
-            )
+            )])
 
     @property
     def clients(self):
@@ -235,22 +274,23 @@ class CollisionDomainNetwork(_HalfDuplexNetworkBase):
             )
         return None
 
-    def get_position(self, index):
+    def _precompute_positions(self):
+        n = self.sim.params.num_stations
         area_radius = self.sim.params.connection_radius / 2.1
-        distance, angle = uniform(0.1, 1) * area_radius, uniform(0, 2 * pi)
-        position = (distance * cos(angle), distance * sin(angle))
-        return position
+        distance = uniform(0.1, 1, n) * area_radius
+        angle = uniform(0, 2 * pi, n)
+        return distance * np.cos(angle), distance * np.sin(angle)
 
     def write_switch_table(self, index):
         if index > 0:
             sta = self.stations[index]
             iface = sta.interfaces[0]
             switch_conn = sta.get_switch_connection_for(iface)
-            sta.switch.table.add(
+            sta.switch.table.bulk_load([(
                 self.destination_address,
                 switch_conn.name,
                 self.destination_address
-            )
+            )])
 
     @property
     def clients(self):
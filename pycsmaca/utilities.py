@@ -1,6 +1,125 @@
+import sys
+
+import numpy as np
+
 SPEED_OF_LIGHT = 299792458.0
 
 
+def intern_address(value):
+    """Intern string addresses (e.g. MACs) so that keying dicts on them
+    short-circuits on object identity instead of comparing characters.
+    Non-string values are returned unchanged.
+    """
+    return sys.intern(value) if type(value) is str else value
+
+
+class ArrayTrace:
+    """Time-value trace backed by NumPy arrays grown geometrically.
+
+    Replaces `pydesim.Trace` in modules that record a sample on every
+    event: `record()` is two array stores instead of a tuple allocation
+    plus a list append, and the samples are stored sequentially, which
+    keeps memory per sample low and enables vectorized post-processing.
+    """
+    INITIAL_CAPACITY = 1024
+
+    def __init__(self):
+        # Values are stored as floats as well: traces like the queue
+        # bitsize record sums of packet sizes, and sizes drawn from
+        # continuous distributions are not integral.
+        self.__times = np.empty(ArrayTrace.INITIAL_CAPACITY, dtype=np.float64)
+        self.__values = np.empty(ArrayTrace.INITIAL_CAPACITY, dtype=np.float64)
+        self.__size = 0
+
+    @property
+    def times(self):
+        return self.__times[:self.__size]
+
+    @property
+    def values(self):
+        return self.__values[:self.__size]
+
+    def record(self, t, v):
+        n = self.__size
+        if n == self.__times.shape[0]:
+            self.__times = np.concatenate(
+                [self.__times, np.empty_like(self.__times)]
+            )
+            self.__values = np.concatenate(
+                [self.__values, np.empty_like(self.__values)]
+            )
+        self.__times[n] = t
+        self.__values[n] = v
+        self.__size = n + 1
+
+    def as_tuple(self):
+        return tuple(zip(self.times.tolist(), self.values.tolist()))
+
+    def timeavg(self):
+        n = self.__size
+        if n == 0:
+            return 0.0
+        times, values = self.__times[:n], self.__values[:n]
+        span = times[-1] - times[0]
+        if span == 0:
+            return float(values[-1])
+        return float(np.dot(values[:-1], np.diff(times)) / span)
+
+    def __len__(self):
+        return self.__size
+
+    def __str__(self):
+        return 'ArrayTrace' + str(list(self.as_tuple()))
+
+
+class ArrayStatistic:
+    """Scalar sample collector backed by a NumPy array grown geometrically.
+
+    Replaces `pydesim.Statistic` in modules that append a sample on every
+    event: aggregations like `mean()` become one vectorized reduction over
+    a contiguous array instead of a Python loop over a list.
+    """
+    INITIAL_CAPACITY = 1024
+
+    def __init__(self):
+        self.__values = np.empty(
+            ArrayStatistic.INITIAL_CAPACITY, dtype=np.float64
+        )
+        self.__size = 0
+
+    @property
+    def values(self):
+        return self.__values[:self.__size]
+
+    def append(self, value):
+        n = self.__size
+        if n == self.__values.shape[0]:
+            self.__values = np.concatenate(
+                [self.__values, np.empty_like(self.__values)]
+            )
+        self.__values[n] = value
+        self.__size = n + 1
+
+    def mean(self):
+        if self.__size == 0:
+            return 0.0
+        return float(self.values.mean())
+
+    def std(self):
+        if self.__size == 0:
+            return 0.0
+        return float(self.values.std())
+
+    def as_tuple(self):
+        return tuple(self.values.tolist())
+
+    def __len__(self):
+        return self.__size
+
+    def __str__(self):
+        return 'ArrayStatistic' + str(list(self.as_tuple()))
+
+
 class ReadOnlyDict:
     def __init__(self, data):
         self.__data = data
@@ -1,5 +1,17 @@
 from setuptools import setup
 
+try:
+    # When Cython is available, the dispatch-bound wired interface module
+    # is compiled to a C extension; the pure-Python sources stay the
+    # fallback when it is not installed.
+    from Cython.Build import cythonize
+    ext_modules = cythonize(
+        ['pycsmaca/simulations/modules/wired_interface.py'],
+        language_level=3,
+    )
+except ImportError:
+    ext_modules = []
+
 
 def readme():
     with open('README.md') as f:
@@ -24,6 +36,7 @@ setup(name='pycsmaca',
       license='MIT',
       packages=['pycsmaca'],
       scripts=[],
+      ext_modules=ext_modules,
       install_requires=[
           'scipy',
           'pydesim',
@@ -36,5 +49,5 @@ setup(name='pycsmaca',
       include_package_data=True,
       zip_safe=False,
       setup_requires=["pytest-runner", "pytest-repeat"],
-      tests_require=["pytest", 'pyqumo', 'pydesim'],
+      tests_require=["pytest", "pytest-xdist", 'pyqumo', 'pydesim'],
     )
@@ -0,0 +1,164 @@
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+import pytest
+
+
+# Attribute specs for the module mocks below. `spec_set` keeps Mock from
+# silently materialising a child for a mistyped attribute, and skips the
+# lazy child-mock allocation for attributes the code never touches. The
+# simulator spec lists everything the package reads from `sim`; module
+# mocks expose the pydesim module surface the tests interact with.
+_SIM_SPEC = ['schedule', 'cancel', 'stime', 'logger', 'params']
+_MODULE_SPEC = ['sim', 'connections', '_set_parent', 'handle_message']
+_QUEUE_SPEC = _MODULE_SPEC + ['get_next']
+
+
+# The class-patching fixtures below use `monkeypatch.setattr` with a
+# pre-built mock instead of `unittest.mock.patch`: it replaces the
+# attribute directly, without the save/introspect machinery of `_patch`,
+# and pytest restores the original class automatically.
+
+# noinspection PyPep8Naming
+@pytest.fixture
+def AppDataMock(monkeypatch):
+    """`AppData` class patched inside the app layer module."""
+    from pycsmaca.simulations.modules import app_layer
+    mock = Mock()
+    monkeypatch.setattr(app_layer, 'AppData', mock)
+    return mock
+
+
+# noinspection PyPep8Naming
+@pytest.fixture
+def NetworkPacketMock(monkeypatch):
+    """`NetworkPacket` class patched inside the network layer module."""
+    from pycsmaca.simulations.modules import network_layer
+    mock = Mock()
+    monkeypatch.setattr(network_layer, 'NetworkPacket', mock)
+    return mock
+
+
+# noinspection PyPep8Naming
+@pytest.fixture
+def WireFrameMock(monkeypatch):
+    """`WireFrame` class patched inside the wired interface module."""
+    from pycsmaca.simulations.modules import wired_interface
+    mock = Mock()
+    monkeypatch.setattr(wired_interface, 'WireFrame', mock)
+    return mock
+
+
+@pytest.fixture(scope='session')
+def dummy_model_cls():
+    """Class of a minimal full-functioning model with a fixed string name.
+
+    Shared by tests that need a real (non-mock) module endpoint. pydesim
+    is imported lazily so that tests without simulator dependencies can
+    be collected without it.
+    """
+    from pydesim import Model
+
+    class DummyModel(Model):
+        def __init__(self, sim, name):
+            super().__init__(sim)
+            self.name = name
+
+        def __str__(self):
+            return self.name
+
+    return DummyModel
+
+
+@pytest.fixture
+def sim():
+    """A `pydesim.Simulator` mock with simulation time set to zero."""
+    mock = Mock(spec_set=_SIM_SPEC)
+    mock.stime = 0
+    return mock
+
+
+@pytest.fixture
+def sim_ns():
+    """A lightweight `sim` stand-in for tests that assign `stime` a lot.
+
+    A `SimpleNamespace` serves plain attribute reads and writes without
+    Mock's child-mock machinery, while exposing the same surface as the
+    `sim` fixture; `schedule`, `cancel` and `logger` stay mocks so calls
+    on them can still be asserted.
+    """
+    return SimpleNamespace(stime=0, schedule=Mock(), cancel=Mock(),
+                           logger=Mock(), params=SimpleNamespace())
+
+
+@pytest.fixture
+def peer():
+    """Plain mock of the module at the other end of the wire."""
+    return Mock(spec_set=_MODULE_SPEC)
+
+
+@pytest.fixture
+def queue():
+    """Plain mock of a queue module."""
+    return Mock(spec_set=_QUEUE_SPEC)
+
+
+@pytest.fixture
+def switch():
+    """Plain mock of a switch module."""
+    return Mock(spec_set=_MODULE_SPEC)
+
+
+@pytest.fixture
+def sender():
+    """Plain mock of a sending module."""
+    return Mock(spec_set=_MODULE_SPEC)
+
+
+@pytest.fixture
+def user():
+    """Plain mock of an interface user module."""
+    return Mock(spec_set=_MODULE_SPEC)
+
+
+@pytest.fixture
+def transceiver():
+    """Plain mock of a transceiver module."""
+    return Mock(spec_set=_MODULE_SPEC)
+
+
+@pytest.fixture
+def assert_scheduled():
+    """Checker verifying a batch of expected scheduler calls against one
+    snapshot of the recorded call list, instead of one
+    `assert_any_call()` scan per expectation.
+    """
+    def _assert(mock_sched, expected):
+        got = list(mock_sched.call_args_list)
+        for exp in expected:
+            assert exp in got, f'missing {exp} in {got}'
+    return _assert
+
+
+@pytest.fixture
+def make_service_pair():
+    """Factory behind `service_pair`: builds a service module mock along
+    with the reverse connection its `connections.set()` call returns.
+    An existing mock may be passed to only attach the stubbed reverse
+    connection.
+    """
+    def _make(module=None):
+        if module is None:
+            module = Mock(spec_set=_QUEUE_SPEC)
+        rev_conn = Mock()
+        module.connections.set = Mock(return_value=rev_conn)
+        return module, rev_conn
+    return _make
+
+
+@pytest.fixture
+def service_pair(make_service_pair):
+    """A service module mock paired with the reverse connection returned
+    by its `connections.set()` call.
+    """
+    return make_service_pair()
@@ -1,40 +1,34 @@
 import pytest
-from numpy import argmin, cumsum, inf, asarray
 from pydesim import Model, simulate, Statistic, Intervals
-from unittest.mock import Mock, patch, ANY
+from unittest.mock import Mock, ANY
 from pycsmaca.simulations.modules.app_layer import RandomSource, AppData, \
     Sink, ControlledSource
 
 
-class DummyModel(Model):
-    """We use this `DummyModel` when we need a full-functioning model.
-    """
-    def __init__(self, sim, name):
-        super().__init__(sim)
-        self.name = name
-
-    def __str__(self):
-        return self.name
-
-
 #############################################################################
 # TEST RandomSource MODULE
 #############################################################################
 
 # noinspection PyProtectedMember
-def test_random_source_generates_packets():
+@pytest.mark.parametrize('data_size, interval, size, intervals', [
+    pytest.param(Mock(return_value=42), Mock(side_effect=(74, 21)), 42,
+                 (74, 21), id='callable-distributions'),
+    pytest.param(123, 34, 123, (34, 34), id='constant-distributions'),
+])
+def test_random_source_generates_packets(sim, AppDataMock, data_size,
+                                         interval, size, intervals):
     """In this test we check that `RandomSource` properly generates `AppData`.
+
+    Both callable distributions and numeric constants are validated here,
+    one parametrized case per distribution kind.
     """
     # First, we create the `RandomSource` module, validate it is
     # inherited from `pydesim.Module` and check that upon construction source
     # scheduled the next packet arrival as specified by `interval` parameter:
-    sim = Mock()
-    sim.stime = 0
-    source = RandomSource(sim, data_size=Mock(return_value=42),
-                          interval=Mock(side_effect=(74, 21)), source_id=34,
-                          dest_addr=13)
+    source = RandomSource(sim, data_size=data_size, interval=interval,
+                          source_id=34, dest_addr=13)
     assert isinstance(source, Model)
-    sim.schedule.assert_called_with(74, source._generate)
+    sim.schedule.assert_called_with(intervals[0], source._generate)
 
     # Define a mock for NetworkLayer module and establish a connection:
     network_service_mock = Mock()
@@ -45,56 +39,29 @@ def test_random_source_generates_packets():
     # Exactly it means that the connected module `handle_message(packet)`
     # method is called using `sim.schedule`, which is expected to be called
     # from within `source.connections['network']` connection.
-    with patch('pycsmaca.simulations.modules.app_layer.AppData') as AppDataMock:
-        _spec = dict(dest_addr=13, size=42, source_id=34, created_at=0)
-        _packet = Mock(**_spec)
-        AppDataMock.return_value = _packet
+    _spec = dict(dest_addr=13, size=size, source_id=34, created_at=0)
+    _packet = Mock(**_spec)
+    AppDataMock.return_value = _packet
 
-        source._generate()
+    source._generate()
 
-        AppDataMock.assert_called_with(**_spec)
+    AppDataMock.assert_called_with(**_spec)
 
-        rev_conn = source.connections['network'].reverse
-        sim.schedule.assert_any_call(
-            0, network_service_mock.handle_message, args=(_packet,),
-            kwargs={'sender': source, 'connection': rev_conn}
-        )
+    rev_conn = source.connections['network'].reverse
+    sim.schedule.assert_any_call(
+        0, network_service_mock.handle_message, args=(_packet,),
+        kwargs={'sender': source, 'connection': rev_conn}
+    )
 
     # Finally, we make sure that after the _generate() call another event
     # was scheduled:
-    sim.schedule.assert_any_call(21, source._generate)
-
-
-# noinspection PyProtectedMember
-def test_random_source_can_use_constant_distributions():
-    """Validate that numeric constants can be used instead of distributions.
-    """
-    sim = Mock()
-    sim.stime = 0
-    source = RandomSource(
-        sim, data_size=123, interval=34, source_id=0, dest_addr=1)
-
-    network_service_mock = Mock()
-    source.connections['network'] = network_service_mock
-    sim.schedule.assert_called_with(34, source._generate)
-
-    with patch('pycsmaca.simulations.modules.app_layer.AppData') as AppDataMock:
-        _spec = dict(dest_addr=1, size=123, source_id=0, created_at=0)
-        _packet = Mock(**_spec)
-        AppDataMock.return_value = _packet
-
-        source._generate()
-        AppDataMock.assert_called_with(**_spec)
-
-    sim.schedule.assert_any_call(34, source._generate)
+    sim.schedule.assert_any_call(intervals[1], source._generate)
 
 
 # noinspection PyProtectedMember
-def test_random_source_can_use_finite_intervals_distributions():
+def test_random_source_can_use_finite_intervals_distributions(sim):
     """Validate that `RandomSource` will stop when intervals is finite tuple.
     """
-    sim = Mock()
-    sim.stime = 0
     source = RandomSource(
         sim, data_size=123, interval=(34, 42,), source_id=0, dest_addr=1)
 
@@ -117,67 +84,75 @@ def test_random_source_can_use_finite_intervals_distributions():
 
 
 # noinspection PyProtectedMember
-def test_random_source_can_use_finite_data_size_distributions():
+def test_random_source_can_use_finite_data_size_distributions(
+        sim, AppDataMock):
     """Validate that `RandomSource` will stop when data size is finite tuple.
     """
-    sim = Mock()
-    sim.stime = 0
     source = RandomSource(
         sim, data_size=(10, 20), interval=100, source_id=0, dest_addr=1)
 
     network_service_mock = Mock()
     source.connections['network'] = network_service_mock
 
-    with patch('pycsmaca.simulations.modules.app_layer.AppData') as AppDataMock:
-        source._generate()
-        AppDataMock.assert_called_with(dest_addr=1, source_id=0, size=10,
-                                       created_at=0)
-        AppDataMock.reset_mock()
+    source._generate()
+    AppDataMock.assert_called_with(dest_addr=1, source_id=0, size=10,
+                                   created_at=0)
+    AppDataMock.reset_mock()
+
+    source._generate()
+    AppDataMock.assert_called_with(dest_addr=1, source_id=0, size=20,
+                                   created_at=0)
+    AppDataMock.reset_mock()
+
+    sim.schedule.reset_mock()
+    source._generate()
+    AppDataMock.assert_not_called()
+    sim.schedule.assert_not_called()
 
-        source._generate()
-        AppDataMock.assert_called_with(dest_addr=1, source_id=0, size=20,
-                                       created_at=0)
-        AppDataMock.reset_mock()
 
-        sim.schedule.reset_mock()
-        source._generate()
-        AppDataMock.assert_not_called()
-        sim.schedule.assert_not_called()
+RANDOM_SOURCE_INTERVALS = (10, 12, 15, 17)
+RANDOM_SOURCE_DATA_SIZE = (123, 453, 245, 321)
 
 
-# noinspection PyProtectedMember
-def test_random_source_provides_statistics():
-    """Validate that `RandomSource` provides statistics.
+@pytest.fixture(scope='module')
+def random_source_sim_result(dummy_model_cls):
+    """Simulation result of a model with one `RandomSource`. All the
+    statistics tests assert against this same run.
     """
-    intervals = (10, 12, 15, 17)
-    data_size = (123, 453, 245, 321)
-
-    class TestModel(Model):
+    class RandomSourceModel(Model):
         def __init__(self, sim):
             super().__init__(sim)
             self.source = RandomSource(
                 sim, source_id=34, dest_addr=13,
-                data_size=Mock(side_effect=data_size),
-                interval=Mock(side_effect=(intervals + (1000,))),
+                data_size=Mock(side_effect=RANDOM_SOURCE_DATA_SIZE),
+                interval=Mock(side_effect=(RANDOM_SOURCE_INTERVALS + (1000,))),
             )
-            self.network = DummyModel(sim, 'Network')
+            self.network = dummy_model_cls(sim, 'Network')
             self.source.connections['network'] = self.network
 
-    ret = simulate(TestModel, stime_limit=sum(intervals))
+    return simulate(
+        RandomSourceModel, stime_limit=sum(RANDOM_SOURCE_INTERVALS))
 
-    assert ret.data.source.arrival_intervals.as_tuple() == intervals
-    assert ret.data.source.data_size_stat.as_tuple() == data_size
 
-    # Also check that we can not replace statistics:
-    with pytest.raises(AttributeError):
-        from pydesim import Intervals
-        ret.data.source.arrival_intervals = Intervals()
-    with pytest.raises(AttributeError):
-        from pydesim import Statistic
-        ret.data.source.data_size_stat = Statistic()
+def test_random_source_records_statistics(random_source_sim_result):
+    """Validate that `RandomSource` provides statistics.
+    """
+    source = random_source_sim_result.data.source
+    assert source.arrival_intervals.as_tuple() == RANDOM_SOURCE_INTERVALS
+    assert source.data_size_stat.as_tuple() == RANDOM_SOURCE_DATA_SIZE
 
     # Check that source records the number of packets being sent:
-    assert ret.data.source.num_packets_sent == 4
+    assert source.num_packets_sent == 4
+
+
+def test_random_source_statistics_are_read_only(random_source_sim_result):
+    """Validate that `RandomSource` statistics can not be replaced.
+    """
+    source = random_source_sim_result.data.source
+    with pytest.raises(AttributeError):
+        source.arrival_intervals = Intervals()
+    with pytest.raises(AttributeError):
+        source.data_size_stat = Statistic()
 
 
 #############################################################################
@@ -228,6 +203,9 @@ def test_sink_module_records_statistics():
     sources and one sink. Each source generates three messages within given
     intervals and with given sizes.
     """
+    # The only numpy consumer in this module; imported lazily:
+    from numpy import argmin, asarray, cumsum, inf
+
     delays = [(5, 2, 234), (10, 3, 135)]
     intervals = [(10, 10, 200), (20, 400, 80)]
     sizes = [(1234, 1625, 1452), (2534, 2124, 2664)]
@@ -306,7 +284,7 @@ def test_sink_model_implements_str():
 #############################################################################
 
 # noinspection PyProtectedMember
-def test_controlled_source_generates_packets():
+def test_controlled_source_generates_packets(AppDataMock):
     """In this test we check that `ControlledSource` generates `AppData`.
     """
     # First, we create the `ControlledSource` module, validate it is
@@ -329,24 +307,23 @@ def test_controlled_source_generates_packets():
     # method is called using `sim.schedule`, which is expected to be called
     # from within `source.connections['network']` connection.
     # We also make sure that was the only call, no next arrival scheduled.
-    with patch('pycsmaca.simulations.modules.app_layer.AppData') as AppDataMock:
-        _spec = dict(dest_addr=13, size=42, source_id=34, created_at=0)
-        _packet = Mock(**_spec)
-        AppDataMock.return_value = _packet
+    _spec = dict(dest_addr=13, size=42, source_id=34, created_at=0)
+    _packet = Mock(**_spec)
+    AppDataMock.return_value = _packet
 
-        source.get_next()
+    source.get_next()
 
-        AppDataMock.assert_called_with(**_spec)
+    AppDataMock.assert_called_with(**_spec)
 
-        rev_conn = source.connections['network'].reverse
-        sim.schedule.assert_called_once_with(
-            0, network_service_mock.handle_message, args=(_packet,),
-            kwargs={'sender': source, 'connection': rev_conn}
-        )
+    rev_conn = source.connections['network'].reverse
+    sim.schedule.assert_called_once_with(
+        0, network_service_mock.handle_message, args=(_packet,),
+        kwargs={'sender': source, 'connection': rev_conn}
+    )
 
 
 # noinspection PyProtectedMember
-def test_controlled_source_can_use_constant_size_distribution():
+def test_controlled_source_can_use_constant_size_distribution(AppDataMock):
     """Validate that numeric constant can be used instead of size distribution.
     """
     sim = Mock()
@@ -356,18 +333,18 @@ def test_controlled_source_can_use_constant_size_distribution():
     network_service_mock = Mock()
     source.connections['network'] = network_service_mock
 
-    with patch('pycsmaca.simulations.modules.app_layer.AppData') as AppDataMock:
-        _spec = dict(dest_addr=1, size=123, source_id=0, created_at=0)
-        _packet = Mock(**_spec)
-        AppDataMock.return_value = _packet
+    _spec = dict(dest_addr=1, size=123, source_id=0, created_at=0)
+    _packet = Mock(**_spec)
+    AppDataMock.return_value = _packet
 
-        source.get_next()
+    source.get_next()
 
-        AppDataMock.assert_called_with(**_spec)
+    AppDataMock.assert_called_with(**_spec)
 
 
 # noinspection PyProtectedMember
-def test_controlled_source_can_use_finite_data_size_distributions():
+def test_controlled_source_can_use_finite_data_size_distributions(
+        AppDataMock):
     """Validate `ControlledSource` will stop if data size is a finite tuple.
     """
     sim = Mock()
@@ -377,26 +354,25 @@ def test_controlled_source_can_use_finite_data_size_distributions():
     network_service_mock = Mock()
     source.connections['network'] = network_service_mock
 
-    with patch('pycsmaca.simulations.modules.app_layer.AppData') as AppDataMock:
-        source.get_next()
-        AppDataMock.assert_called_with(
-            dest_addr=1, source_id=0, size=10, created_at=0)
-        AppDataMock.reset_mock()
+    source.get_next()
+    AppDataMock.assert_called_with(
+        dest_addr=1, source_id=0, size=10, created_at=0)
+    AppDataMock.reset_mock()
 
-        sim.stime = 5.2
-        source.get_next()
-        AppDataMock.assert_called_with(
-            dest_addr=1, source_id=0, size=20, created_at=5.2)
-        AppDataMock.reset_mock()
+    sim.stime = 5.2
+    source.get_next()
+    AppDataMock.assert_called_with(
+        dest_addr=1, source_id=0, size=20, created_at=5.2)
+    AppDataMock.reset_mock()
 
-        sim.schedule.reset_mock()
-        source.get_next()
-        AppDataMock.assert_not_called()
-        sim.schedule.assert_not_called()
+    sim.schedule.reset_mock()
+    source.get_next()
+    AppDataMock.assert_not_called()
+    sim.schedule.assert_not_called()
 
 
 # noinspection PyProtectedMember
-def test_controlled_source_provides_statistics():
+def test_controlled_source_provides_statistics(dummy_model_cls):
     """Validate that `ControlledSource` provides statistics.
     """
     intervals = (10, 12, 15, 17)
@@ -425,7 +401,7 @@ def test_controlled_source_provides_statistics():
                 sim, source_id=34, dest_addr=13,
                 data_size=Mock(side_effect=data_size),
             )
-            self.network = DummyModel(sim, 'Network')
+            self.network = dummy_model_cls(sim, 'Network')
             self.source.connections['network'] = self.network
             self.controller = SourceController(sim, self.source)
 
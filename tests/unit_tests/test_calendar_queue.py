@@ -0,0 +1,65 @@
+import pytest
+
+from pycsmaca._calendar_queue import CalendarQueue
+
+
+def test_calendar_queue_pops_events_in_time_order():
+    cq = CalendarQueue(bucket_width=1.0, nbuckets=8)
+    cq.push(3.5, 'c')
+    cq.push(0.5, 'a')
+    cq.push(2.0, 'b')
+
+    assert len(cq) == 3
+    assert cq.pop_next() == (0.5, 'a')
+    assert cq.pop_next() == (2.0, 'b')
+    assert cq.pop_next() == (3.5, 'c')
+    assert cq.empty()
+
+
+def test_calendar_queue_pops_equal_times_in_fifo_order():
+    cq = CalendarQueue(bucket_width=1.0, nbuckets=8)
+    cq.push(1.0, 'first')
+    cq.push(1.0, 'second')
+    cq.push(1.0, 'third')
+
+    assert [cq.pop_next()[1] for _ in range(3)] == [
+        'first', 'second', 'third',
+    ]
+
+
+def test_calendar_queue_handles_events_beyond_one_ring_year():
+    cq = CalendarQueue(bucket_width=1.0, nbuckets=4)
+    # 0.5 and 8.5 hash into the same bucket, but belong to different
+    # "years" of the ring; 100.0 lies far beyond the first year:
+    cq.push(8.5, 'late')
+    cq.push(0.5, 'early')
+    cq.push(100.0, 'far')
+
+    assert cq.pop_next() == (0.5, 'early')
+    assert cq.pop_next() == (8.5, 'late')
+    assert cq.pop_next() == (100.0, 'far')
+
+
+def test_calendar_queue_interleaves_pushes_and_pops():
+    cq = CalendarQueue(bucket_width=0.25, nbuckets=16)
+    cq.push(0.1, 'a')
+    assert cq.pop_next() == (0.1, 'a')
+    cq.push(0.3, 'b')
+    cq.push(0.2, 'c')
+    assert cq.pop_next() == (0.2, 'c')
+    cq.push(0.2, 'd')  # same time as current is allowed
+    assert cq.pop_next() == (0.2, 'd')
+    assert cq.pop_next() == (0.3, 'b')
+
+
+def test_calendar_queue_rejects_past_and_empty_pops():
+    cq = CalendarQueue(bucket_width=1.0)
+    cq.push(5.0, 'x')
+    assert cq.pop_next() == (5.0, 'x')
+
+    with pytest.raises(ValueError):
+        cq.push(4.0, 'past')
+    with pytest.raises(IndexError):
+        cq.pop_next()
+    with pytest.raises(ValueError):
+        CalendarQueue(bucket_width=0)
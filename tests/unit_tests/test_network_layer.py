@@ -1,63 +1,50 @@
-from unittest.mock import Mock, patch, MagicMock
+from types import SimpleNamespace
+from unittest.mock import Mock, MagicMock
 
 import pytest
-from pydesim import Model
 
 from pycsmaca.simulations.modules.network_layer import NetworkService, \
     NetworkPacket, SwitchTable, NetworkSwitch
 
-NET_PACKET_CLASS = 'pycsmaca.simulations.modules.network_layer.NetworkPacket'
-
-
-class DummyModel(Model):
-    """We use this `DummyModel` when we need a full-functioning model.
-    """
-    def __init__(self, sim, name):
-        super().__init__(sim)
-        self.name = name
-
-    def __str__(self):
-        return self.name
-
 
 #############################################################################
 # TEST NetworkService
 #############################################################################
-def test_network_service_accepts_packets_from_app():
+def test_network_service_accepts_packets_from_app(NetworkPacketMock,
+                                                   make_service_pair):
     sim, app, net = Mock(), Mock(), Mock()
     ns = NetworkService(sim)
     app_conn = ns.connections.set('source', app, reverse=False)
 
-    net_conn = Mock()
-    net.connections.set = Mock(return_value=net_conn)
+    _, net_conn = make_service_pair(net)
 
     ns.connections.set('network', net, rname='user')
     net.connections.set.assert_called_once_with('user', ns, reverse=False)
 
-    # Now we simulate packet arrival from APP:
-    app_data = Mock()
-    app_data.destination_address = 13
+    # Now we simulate packet arrival from APP (a plain data holder is
+    # enough — no calls on the app data itself are inspected):
+    app_data = SimpleNamespace(destination_address=13)
 
-    with patch(NET_PACKET_CLASS) as NetworkPacketMock:
-        pkt_spec = dict(destination_address=13, data=app_data)
-        packet_instance_mock = Mock()
-        NetworkPacketMock.return_value = packet_instance_mock
+    pkt_spec = dict(destination_address=13, data=app_data)
+    packet_instance_mock = Mock()
+    NetworkPacketMock.return_value = packet_instance_mock
 
-        # Calling `handle_message()` as it to be called upon receiving new
-        # `AppData` from 'app' connection:
-        ns.handle_message(app_data, connection=app_conn, sender=app)
+    # Calling `handle_message()` as it to be called upon receiving new
+    # `AppData` from 'app' connection:
+    ns.handle_message(app_data, connection=app_conn, sender=app)
 
-        # Check that a packet was properly created and also that
-        # Network.handle_message() was called:
-        NetworkPacketMock.assert_called_once_with(**pkt_spec)
-        sim.schedule.assert_called_with(
-            0, net.handle_message, args=(packet_instance_mock,), kwargs={
-                'connection': net_conn, 'sender': ns,
-            }
-        )
+    # Check that a packet was properly created and also that
+    # Network.handle_message() was called:
+    NetworkPacketMock.assert_called_once_with(**pkt_spec)
+    sim.schedule.assert_called_with(
+        0, net.handle_message, args=(packet_instance_mock,), kwargs={
+            'connection': net_conn, 'sender': ns,
+        }
+    )
 
 
-def test_network_service_fills_data_and_dst_addr_for_packet_from_app():
+def test_network_service_fills_data_and_dst_addr_for_packet_from_app(
+        make_service_pair):
     sim, app, net = Mock(), Mock(), Mock()
     ns = NetworkService(sim)
 
@@ -73,51 +60,46 @@ def test_network_service_fills_data_and_dst_addr_for_packet_from_app():
         assert packet.sender_address is None
         assert packet.receiver_address is None
 
-    net_rev_conn = Mock()
-    net.connections.set = Mock(return_value=net_rev_conn)
+    _, net_rev_conn = make_service_pair(net)
 
     ns.connections.set('network', net, rname='user')
     app_conn = ns.connections.set('source', app, reverse=False)
 
     # Now we simulate packet arrival from APP:
-    app_data = Mock()
-    app_data.destination_address = 13
+    app_data = SimpleNamespace(destination_address=13)
 
     sim.schedule = Mock(side_effect=schedule_mock)
     ns.handle_message(app_data, connection=app_conn, sender=app)
     sim.schedule.assert_called_once()
 
 
-def test_network_service_ignores_app_data_via_other_connections():
+def test_network_service_ignores_app_data_via_other_connections(
+        NetworkPacketMock):
     sim, app = Mock(), Mock()
     ns = NetworkService(sim)
     wrong_app_conn = ns.connections.set('wrong_name', app, reverse=False)
 
     # Now we simulate packet arrival from APP via unsupported connection:
-    app_data = Mock()
-    app_data.destination_address = 1
-    with patch(NET_PACKET_CLASS) as NetworkPacketMock:
-        # Imitate packet AppData arrival via wrong connections and make
-        # sure it doesn't cause NetworkPacket instantiation:
-        ns.handle_message(app_data, connection=wrong_app_conn, sender=app)
-        NetworkPacketMock.assert_not_called()
+    app_data = SimpleNamespace(destination_address=1)
+    # Imitate packet AppData arrival via wrong connections and make
+    # sure it doesn't cause NetworkPacket instantiation:
+    ns.handle_message(app_data, connection=wrong_app_conn, sender=app)
+    NetworkPacketMock.assert_not_called()
 
 
-def test_network_service_accept_packets_from_network():
+def test_network_service_accept_packets_from_network(make_service_pair):
     sim, network, sink = Mock(), Mock(), Mock()
     ns = NetworkService(sim)
     net_conn = ns.connections.set('network', network, reverse=False)
 
-    sink_conn = Mock()
-    sink.connections.set = Mock(return_value=sink_conn)
+    _, sink_conn = make_service_pair(sink)
     ns.connections.set('sink', sink, rname='network')
 
     # Now we are going to simulate `NetworkPacket` arrival and make sure
     # `AppData` is extracted and passed up via the "sink" connection.
     # First, we define app_data and network_packet:
     app_data = Mock()
-    network_packet = Mock()
-    network_packet.data = app_data
+    network_packet = SimpleNamespace(data=app_data)
 
     # Calling `handle_message()` as it to be called upon receiving new
     # `NetworkPacket` from 'network' connection:
@@ -143,9 +125,9 @@ def test_network_service_ignores_net_packets_received_via_other_connections():
     sim.schedule.assert_not_called()
 
 
-def test_str_uses_parent_if_specified():
+def test_str_uses_parent_if_specified(dummy_model_cls):
     sim = Mock()
-    parent = DummyModel(sim, 'DummyParent')
+    parent = dummy_model_cls(sim, 'DummyParent')
     ns1 = NetworkService(sim)
     ns2 = NetworkService(sim)
     parent.children['ns'] = ns2
@@ -249,6 +231,18 @@ def test_switch_table_implements_contains_magic_method():
     assert 14 not in table
 
 
+def test_switch_table_bulk_load_adds_many_records():
+    table = SwitchTable()
+    table.add(10, connection='eth0', next_hop=4)
+    table.bulk_load([(22, 'eth1', 3), (35, 'wifi', 7)])
+
+    assert table.as_dict() == {
+        10: ('eth0', 4), 22: ('eth1', 3), 35: ('wifi', 7),
+    }
+    assert table[22].connection == 'eth1'
+    assert table[35].next_hop == 7
+
+
 def test_switch_table_add_replaces_existing_record():
     table = SwitchTable()
     table.add(10, connection='eth0', next_hop=4)
@@ -277,7 +271,8 @@ def test_network_switch_provides_table_read_only_property():
         switch.table = SwitchTable()
 
 
-def test_network_switch_routes_packets_from_user_to_remote_destinations():
+def test_network_switch_routes_packets_from_user_to_remote_destinations(
+        make_service_pair):
     """Validate packets from source to known destination are properly served.
 
     In this test we define a model with `NetworkService` (mock'ed),
@@ -294,11 +289,9 @@ def test_network_switch_routes_packets_from_user_to_remote_destinations():
     switch = NetworkSwitch(sim)
 
     eth.address = 4
-    eth_conn = Mock()
-    eth.connections.set = Mock(return_value=eth_conn)
+    _, eth_conn = make_service_pair(eth)
     wifi.address = 8
-    wifi_conn = Mock()
-    wifi.connections.set = Mock(return_value=wifi_conn)
+    _, wifi_conn = make_service_pair(wifi)
 
     user_conn = switch.connections.set('user', ns, reverse=False)
     switch.connections.set('eth', eth, rname='network')
@@ -333,15 +326,15 @@ def test_network_switch_routes_packets_from_user_to_remote_destinations():
     assert pkt_2.osn >= 0         # = any value, but not None
 
 
-def test_network_switch_increments_ssn_for_successive_packets_from_same_src():
+def test_network_switch_increments_ssn_for_successive_packets_from_same_src(
+        make_service_pair):
     """Validate when two packets come from 'user' to same dest, SSN increments.
     """
     sim, ns, eth = Mock(), Mock(), Mock()
     switch = NetworkSwitch(sim)
 
     eth.address = 1
-    eth_conn = Mock()
-    eth.connections.set = Mock(return_value=eth_conn)
+    _, eth_conn = make_service_pair(eth)
 
     user_conn = switch.connections.set('user', ns, reverse=False)
     switch.connections.set('eth', eth, rname='network')
@@ -358,15 +351,15 @@ def test_network_switch_increments_ssn_for_successive_packets_from_same_src():
     assert pkt_2.osn > pkt_1.osn
 
 
-def test_network_switch_ignores_packets_to_unknown_destinations():
+def test_network_switch_ignores_packets_to_unknown_destinations(
+        make_service_pair):
     """Validate `NetworkSwitch` ignores messages without source not from 'user'.
     """
     sim, ns, eth = Mock(), Mock(), Mock()
     switch = NetworkSwitch(sim)
 
     eth.address = 1
-    eth_conn = Mock()
-    eth.connections.set = Mock(return_value=eth_conn)
+    _, eth_conn = make_service_pair(eth)
 
     user_conn = switch.connections.set('invalid', ns, reverse=False)
     switch.connections.set('eth', eth, rname='network')
@@ -379,7 +372,8 @@ def test_network_switch_ignores_packets_to_unknown_destinations():
     sim.schedule.assert_not_called()
 
 
-def test_network_switch_sends_packets_with_its_interface_address_to_user():
+def test_network_switch_sends_packets_with_its_interface_address_to_user(
+        make_service_pair):
     """Validate packet with destination matching one interface is routed up.
 
     We send three packets: one from 'eth', one from 'wifi' and one from 'user'.
@@ -388,8 +382,7 @@ def test_network_switch_sends_packets_with_its_interface_address_to_user():
     sim, ns, wifi, eth = Mock(), Mock(), Mock(), Mock()
     switch = NetworkSwitch(sim)
 
-    ns_rev_conn = Mock()
-    ns.connections.set = Mock(return_value=ns_rev_conn)
+    _, ns_rev_conn = make_service_pair(ns)
 
     eth.address = 1
     wifi.address = 2
@@ -430,7 +423,8 @@ def test_network_switch_sends_packets_with_its_interface_address_to_user():
     sim.schedule.reset_mock()
 
 
-def test_network_switch_forwards_packets_received_from_network_interfaces():
+def test_network_switch_forwards_packets_received_from_network_interfaces(
+        make_service_pair):
     """Validate packet with destination matching one interface is routed up.
 
     We send three packets: one from 'eth', one from 'wifi' and one from 'user'.
@@ -440,12 +434,10 @@ def test_network_switch_forwards_packets_received_from_network_interfaces():
     switch = NetworkSwitch(sim)
 
     eth.address = 1
-    eth_rev_conn = Mock()
-    eth.connections.set = Mock(return_value=eth_rev_conn)
+    _, eth_rev_conn = make_service_pair(eth)
 
     wifi.address = 20
-    wifi_rev_conn = Mock()
-    wifi.connections.set = Mock(return_value=wifi_rev_conn)
+    _, wifi_rev_conn = make_service_pair(wifi)
 
     switch.connections.set('user', ns, reverse=False)
     switch.connections.set('eth', eth, rname='network')
@@ -473,18 +465,16 @@ def test_network_switch_forwards_packets_received_from_network_interfaces():
     )
 
 
-def test_network_switch_ignores_old_messages():
+def test_network_switch_ignores_old_messages(make_service_pair):
     """Validate `NetworkSwitch` ignores messages with old SSN.
     """
     sim, ns, iface = Mock(), Mock(), Mock()
     switch = NetworkSwitch(sim)
 
     iface.address = 1
-    iface_rev_conn = Mock()
-    iface.connections.set = Mock(return_value=iface_rev_conn)
+    _, iface_rev_conn = make_service_pair(iface)
 
-    ns_rev_conn = Mock()
-    ns.connections.set = Mock(return_value=ns_rev_conn)
+    _, ns_rev_conn = make_service_pair(ns)
 
     switch.connections.set('user', ns, rname='network')
     iface_conn = switch.connections.set('iface', iface, rname='network')
@@ -523,7 +513,8 @@ def test_network_switch_ignores_old_messages():
     sim.schedule.assert_not_called()
 
 
-def test_network_switch_updates_addresses_when_forwarding_packet():
+def test_network_switch_updates_addresses_when_forwarding_packet(
+        make_service_pair):
     """Validate sender and receiver addresses are upon forwarding.
     """
     sim, ns, wifi, eth = Mock(), Mock(), Mock(), Mock()
@@ -531,8 +522,7 @@ def test_network_switch_updates_addresses_when_forwarding_packet():
 
     eth.address = 7
     wifi.address = 199
-    wifi_rev_conn = Mock()
-    wifi.connections.set = Mock(return_value=wifi_rev_conn)
+    _, wifi_rev_conn = make_service_pair(wifi)
 
     switch.connections.set('user', ns, reverse=False)
     switch.connections.set('wifi', wifi, rname='network')
@@ -1,8 +1,7 @@
+from random import uniform
 from unittest.mock import Mock
 
 import pytest
-from numpy import cumsum
-from numpy.random.mtrand import uniform
 
 from pycsmaca.simulations.modules.app_layer import AppData
 from pycsmaca.simulations.modules.network_layer import NetworkPacket
@@ -12,10 +11,7 @@ from pycsmaca.simulations.modules.queues import Queue, SaturatedQueue
 #############################################################################
 # TEST Queue
 #############################################################################
-def test_new_finite_queue_is_empty():
-    sim = Mock()
-    sim.stime = 0
-
+def test_new_finite_queue_is_empty(sim):
     queue = Queue(sim, capacity=2)
 
     assert queue.empty()
@@ -26,10 +22,7 @@ def test_new_finite_queue_is_empty():
     assert queue.as_tuple() == ()
 
 
-def test_push_to_empty_queue_without_service_correctly_updates_content():
-    sim = Mock()
-    sim.stime = 0
-
+def test_push_to_empty_queue_without_service_correctly_updates_content(sim):
     queue = Queue(sim, capacity=2)
     data_size = 123
     packet = NetworkPacket(data=AppData(0, data_size, 0, 0))
@@ -43,9 +36,7 @@ def test_push_to_empty_queue_without_service_correctly_updates_content():
     assert tuple(qp.packet for qp in queue.as_tuple()) == (packet,)
 
 
-def test_push_up_to_full_queue_without_service_correctly_updates_content():
-    sim = Mock()
-    sim.stime = 0
+def test_push_up_to_full_queue_without_service_correctly_updates_content(sim):
     data_size = [123, 412]
     packets = [NetworkPacket(data=AppData(0, sz, 0, 0)) for sz in data_size]
 
@@ -61,9 +52,7 @@ def test_push_up_to_full_queue_without_service_correctly_updates_content():
     assert tuple(qp.packet for qp in queue.as_tuple()) == tuple(packets)
 
 
-def test_push_to_full_queue_without_service_drops_last_packet():
-    sim = Mock()
-    sim.stime = 0
+def test_push_to_full_queue_without_service_drops_last_packet(sim):
     data_size = [123, 412]
     packets = [NetworkPacket(data=AppData(0, sz, 0, 0)) for sz in data_size]
 
@@ -86,18 +75,13 @@ def test_push_to_full_queue_without_service_drops_last_packet():
     assert tuple(qp.packet for qp in queue.as_tuple()) == (packets[0],)
 
 
-def test_pop_from_empty_queue_raises_error():
-    sim = Mock()
-    sim.stime = 0
-
+def test_pop_from_empty_queue_raises_error(sim):
     queue = Queue(sim, capacity=2)
     with pytest.raises(ValueError):
         queue.pop()
 
 
-def test_pop_extracts_packets_in_correct_order():
-    sim = Mock()
-    sim.stime = 0
+def test_pop_extracts_packets_in_correct_order(sim):
     data_size = [123, 412]
     packets = [NetworkPacket(data=AppData(0, sz, 0, 0)) for sz in data_size]
 
@@ -122,8 +106,7 @@ def test_pop_extracts_packets_in_correct_order():
     assert queue.as_tuple() == ()
 
 
-def test_finite_queue_without_service_writes_statistics():
-    sim = Mock()
+def test_finite_queue_without_service_writes_statistics(sim):
     size = [123, 412, 230, 312]
     t0, t1, t2, t3, t4, t5 = 2, 7, 8, 10, 14, 19
     packets = [NetworkPacket(data=AppData(0, sz, 0, 0)) for sz in size]
@@ -154,19 +137,20 @@ def test_finite_queue_without_service_writes_statistics():
     assert q.num_dropped == 1
 
 
-def test_infinite_queue_stores_many_enough_packets():
+def test_infinite_queue_stores_many_enough_packets(sim):
+    # The test only checks counters and trace lengths, so a single shared
+    # packet pushed `n` times is enough — no need to allocate `n` distinct
+    # NetworkPacket/AppData pairs:
     n = 50
-    packets = [
-        NetworkPacket(data=AppData(0, uniform(0, 1000), 0, 0)) for _ in range(n)
-    ]
-    times = list(cumsum(uniform(0, 20, n)))
-
-    sim = Mock()
-    sim.stime = 0
+    pkt = NetworkPacket(data=AppData(0, 100, 0, 0))
+    times, t = [], 0.0
+    for _ in range(n):
+        t += uniform(0, 20)
+        times.append(t)
 
     queue = Queue(sim)
 
-    for pkt, t in zip(packets, times):
+    for t in times:
         sim.stime = t
         queue.push(pkt)
 
@@ -175,12 +159,9 @@ def test_infinite_queue_stores_many_enough_packets():
     assert queue.num_dropped == 0
 
 
-def test_queue_with_service_passes_new_packet_directly_after_get_next_call():
-    sim, service = Mock(), Mock()
-    sim.stime = 0
-
-    service_rev_conn = Mock()
-    service.connections.set = Mock(return_value=service_rev_conn)
+def test_queue_with_service_passes_new_packet_directly_after_get_next_call(
+        sim, service_pair):
+    service, service_rev_conn = service_pair
 
     queue = Queue(sim=sim)
     queue.connections.set('service', service, rname='queue')
@@ -206,15 +187,13 @@ def test_queue_with_service_passes_new_packet_directly_after_get_next_call():
     assert queue.num_dropped == 0
 
 
-def test_queue_with_service_passes_single_stored_packet_after_get_next_call():
+def test_queue_with_service_passes_single_stored_packet_after_get_next_call(
+        sim, service_pair):
     t0, t1, t2, t3, t4 = 0, 13, 19, 22, 29
     size = [100, 200, 300]
-    sim, service = Mock(), Mock()
+    service, service_rev_conn = service_pair
     sim.stime = t0
 
-    service_rev_conn = Mock()
-    service.connections.set = Mock(return_value=service_rev_conn)
-
     queue = Queue(sim=sim)
     queue.connections.set('service', service, rname='queue')
 
@@ -253,16 +232,11 @@ def test_queue_with_service_passes_single_stored_packet_after_get_next_call():
     assert queue.num_dropped == 0
 
 
-def test_queue_with_several_services_finds_right_connections():
-    sim, blue, red, green = Mock(), Mock(), Mock(), Mock()
-    sim.stime = 0
-
-    blue_rev_conn = Mock()
-    blue.connections.set = Mock(return_value=blue_rev_conn)
-    red_rev_conn = Mock()
-    red.connections.set = Mock(return_value=red_rev_conn)
-    green_rev_conn = Mock()
-    green.connections.set = Mock(return_value=green_rev_conn)
+def test_queue_with_several_services_finds_right_connections(
+        sim, make_service_pair):
+    blue, blue_rev_conn = make_service_pair()
+    red, red_rev_conn = make_service_pair()
+    green, green_rev_conn = make_service_pair()
 
     queue = Queue(sim=sim)
     queue.connections.set('blue', blue, rname='queue')
@@ -322,9 +296,8 @@ def test_queue_with_several_services_finds_right_connections():
     )
 
 
-def test_data_request_to_queue_from_module_not_connected_raises_error():
-    sim, service = Mock(), Mock()
-    sim.stime = 0
+def test_data_request_to_queue_from_module_not_connected_raises_error(sim):
+    service = Mock()
 
     queue = Queue(sim=sim)
 
@@ -332,9 +305,8 @@ def test_data_request_to_queue_from_module_not_connected_raises_error():
         queue.get_next(service=service)
 
 
-def test_queue_accepts_packets_on_handle_message_call():
-    sim, producer = Mock(), Mock()
-    sim.stime = 0
+def test_queue_accepts_packets_on_handle_message_call(sim):
+    producer = Mock()
 
     queue = Queue(sim=sim)
     conn = queue.connections.set('input', producer, reverse=False)
@@ -348,12 +320,10 @@ def test_queue_accepts_packets_on_handle_message_call():
 #############################################################################
 # TEST SaturatedQueue
 #############################################################################
-def test_saturated_queue_requests_source_packet_when_empty_after_get_next():
-    sim, source, switch, service = Mock(), Mock(), Mock(), Mock()
-    sim.stime = 0
-
-    service_rev_conn = Mock()
-    service.connections.set = Mock(return_value=service_rev_conn)
+def test_saturated_queue_requests_source_packet_when_empty_after_get_next(
+        sim, service_pair):
+    source, switch = Mock(), Mock()
+    service, service_rev_conn = service_pair
 
     queue = SaturatedQueue(sim=sim, source=source)
     queue.connections.set('output', service, rname='queue')
@@ -375,12 +345,10 @@ def test_saturated_queue_requests_source_packet_when_empty_after_get_next():
         })
 
 
-def test_saturated_queue_not_requests_source_when_not_empty_after_get_next():
-    sim, source, switch, service = Mock(), Mock(), Mock(), Mock()
-    sim.stime = 0
-
-    service_rev_conn = Mock()
-    service.connections.set = Mock(return_value=service_rev_conn)
+def test_saturated_queue_not_requests_source_when_not_empty_after_get_next(
+        sim, service_pair):
+    source, switch = Mock(), Mock()
+    service, service_rev_conn = service_pair
 
     queue = SaturatedQueue(sim=sim, source=source)
     queue.connections.set('output', service, rname='queue')
@@ -1,6 +1,6 @@
 import pytest
 
-from pycsmaca.utilities import ReadOnlyDict
+from pycsmaca.utilities import ArrayStatistic, ArrayTrace, ReadOnlyDict
 
 
 ##############################################################################
@@ -67,3 +67,65 @@ def test_read_only_dict_provides_str():
     rod = ReadOnlyDict(data)
 
     assert str(rod) == ('RODict' + str(data))
+
+
+##############################################################################
+# TEST ArrayTrace
+##############################################################################
+def test_array_trace_records_time_value_pairs():
+    trace = ArrayTrace()
+    trace.record(0, 0)
+    trace.record(1.5, 2)
+    trace.record(3.0, 1)
+
+    assert len(trace) == 3
+    assert trace.as_tuple() == ((0, 0), (1.5, 2), (3.0, 1))
+
+
+def test_array_trace_grows_beyond_initial_capacity():
+    trace = ArrayTrace()
+    n = ArrayTrace.INITIAL_CAPACITY * 2 + 10
+    for i in range(n):
+        trace.record(i, i % 5)
+
+    assert len(trace) == n
+    assert trace.as_tuple()[-1] == (n - 1, (n - 1) % 5)
+
+
+def test_array_trace_provides_timeavg():
+    trace = ArrayTrace()
+    assert trace.timeavg() == 0.0
+
+    trace.record(0, 4)
+    assert trace.timeavg() == 4
+
+    trace.record(2, 1)  # value is 4 during [0, 2)
+    trace.record(6, 0)  # value is 1 during [2, 6)
+    assert trace.timeavg() == pytest.approx((4 * 2 + 1 * 4) / 6)
+
+
+##############################################################################
+# TEST ArrayStatistic
+##############################################################################
+def test_array_statistic_aggregates_appended_samples():
+    stat = ArrayStatistic()
+    assert len(stat) == 0
+    assert stat.mean() == 0.0
+
+    for value in (1, 2, 3, 6):
+        stat.append(value)
+
+    assert len(stat) == 4
+    assert stat.as_tuple() == (1, 2, 3, 6)
+    assert stat.mean() == pytest.approx(3.0)
+    assert stat.std() == pytest.approx(1.8708286933869707)
+
+
+def test_array_statistic_grows_beyond_initial_capacity():
+    stat = ArrayStatistic()
+    n = ArrayStatistic.INITIAL_CAPACITY + 10
+    for i in range(n):
+        stat.append(i)
+
+    assert len(stat) == n
+    assert stat.as_tuple()[-1] == n - 1